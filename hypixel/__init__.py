@@ -1,3 +1,53 @@
-from .general import *
-from .games import Game
-from . import bedwars
\ No newline at end of file
+"""A python wrapper for the Hypixel API.
+
+Submodules, and aiohttp along with them, are only imported when one of their names is first used,
+so `import hypixel` stays cheap for short-lived processes.
+"""
+from importlib import import_module
+
+_attributes = {
+    "API_URL": ".general",
+    "Hypixel": ".general",
+    "HypixelException": ".general",
+    "Player": ".general",
+    "ServerError": ".general",
+    "Game": ".games",
+    "Stats": ".games",
+    "Freshness": ".cache",
+    "SQLiteCache": ".cache",
+    "RetryPolicy": ".retry",
+}
+_submodules = {
+    "bedwars": ".bedwars",
+    "bedwars_batch": ".bedwars_batch",
+    "cache": ".cache",
+    "games": ".games",
+    "general": ".general",
+    "loadtest": ".loadtest",
+    "nbt": ".nbt",
+    "retry": ".retry",
+    "skyblock": ".skyblock",
+    "standin": ".standin",
+    # Used to come through `from .general import *`.
+    "auctionhouse": ".skyblock.auctionhouse",
+    "bazaar": ".skyblock.bazaar",
+    "profiles": ".skyblock.profiles",
+}
+
+# The tools with optional or heavy dependencies are left out of `import *`.
+__all__ = list(_attributes) + [i for i in _submodules if i not in ("bedwars_batch", "loadtest", "standin")]
+
+
+def __getattr__(name: str):
+    if name in _attributes:
+        value = getattr(import_module(_attributes[name], __name__), name)
+    elif name in _submodules:
+        value = import_module(_submodules[name], __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_attributes) | set(_submodules))
@@ -51,6 +51,11 @@ class ModeStats:
     purchases: "ItemsPurchased"
     plays: int
 
+    @property
+    def fkdr(self):
+        final_deaths = self.final_deaths.total
+        return self.final_kills.total / final_deaths if final_deaths else float(self.final_kills.total)
+
     @classmethod
     def _handle_mode(cls, json_data: dict[str, int], prefix: str = ""):
         json_data = defaultdict(
@@ -165,7 +170,7 @@ class BedStats:
 
     @property
     def bblr(self):
-        return self.breaks / self.losses
+        return self.breaks / self.losses if self.losses else float(self.breaks)
 
 
 @dataclass(slots=True)
@@ -177,7 +182,7 @@ class WinLossStats:
 
     @property
     def wlr(self):
-        return self.wins / self.losses
+        return self.wins / self.losses if self.losses else float(self.wins)
 
 
 @dataclass(slots=True)
@@ -0,0 +1,102 @@
+"""Bedwars stats for many players at once, stored as NumPy columns for ranking leaderboards.
+
+Needs NumPy, which is an optional dependency (`pip install hypixel-Mathman2028[batch]`).
+"""
+from typing import TYPE_CHECKING, Iterable
+import numpy as np
+
+if TYPE_CHECKING:
+    from .general import Player
+
+# Mode names match the attributes of BedwarsStats.
+MODES = {
+    "all_modes": "",
+    "solo": "eight_one_",
+    "duos": "eight_two_",
+    "threes": "four_three_",
+    "fours": "four_four_",
+    "teams": "two_four_",
+}
+COUNTERS = [
+    "games_played",
+    "wins",
+    "losses",
+    "kills",
+    "deaths",
+    "final_kills",
+    "final_deaths",
+    "beds_broken",
+    "beds_lost",
+]
+
+
+def ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """Divide elementwise. Where the denominator is 0 the ratio is the numerator, as Hypixel shows it."""
+    return np.divide(
+        numerator, denominator, out=numerator.astype(np.float64), where=denominator != 0
+    )
+
+
+class BedwarsBatch:
+    """Bedwars counters for many players, one int64 column per mode and counter."""
+
+    def __init__(self, uuids: list[str], columns: dict[tuple[str, str], np.ndarray]):
+        self.uuids = uuids
+        self.columns = columns
+
+    def __len__(self):
+        return len(self.uuids)
+
+    @classmethod
+    def from_json(cls, stats: dict[str, dict]):
+        """Build a batch from a dict of player UUID to that player's raw `Bedwars` stats."""
+        uuids = list(stats)
+        raw = list(stats.values())
+        columns = {}
+        for mode, prefix in MODES.items():
+            for counter in COUNTERS:
+                key = f"{prefix}{counter}_bedwars"
+                columns[mode, counter] = np.fromiter(
+                    (i.get(key, 0) for i in raw), dtype=np.int64, count=len(raw)
+                )
+        return cls(uuids, columns)
+
+    @classmethod
+    def from_players(cls, players: Iterable["Player"]):
+        return cls.from_json({i.uuid: i.raw_stats.get("Bedwars", {}) for i in players})
+
+    def column(self, counter: str, mode: str = "all_modes") -> np.ndarray:
+        return self.columns[mode, counter]
+
+    def wlr(self, mode: str = "all_modes"):
+        return ratio(self.column("wins", mode), self.column("losses", mode))
+
+    def kdr(self, mode: str = "all_modes"):
+        return ratio(self.column("kills", mode), self.column("deaths", mode))
+
+    def fkdr(self, mode: str = "all_modes"):
+        return ratio(self.column("final_kills", mode), self.column("final_deaths", mode))
+
+    def bblr(self, mode: str = "all_modes"):
+        return ratio(self.column("beds_broken", mode), self.column("beds_lost", mode))
+
+    @staticmethod
+    def top_k(values: np.ndarray, k: int) -> np.ndarray:
+        """Indices of the `k` highest values, highest first."""
+        k = min(k, len(values))
+        if k <= 0:
+            return np.empty(0, dtype=np.intp)
+        top = np.argpartition(values, len(values) - k)[len(values) - k :]
+        return top[np.argsort(values[top], kind="stable")[::-1]]
+
+    @staticmethod
+    def percentile_ranks(values: np.ndarray) -> np.ndarray:
+        """For each player, the percentage of players with a value at or below theirs."""
+        if not len(values):
+            return np.empty(0, dtype=np.float64)
+        ordered = np.sort(values)
+        return np.searchsorted(ordered, values, side="right") * (100 / len(values))
+
+    def leaderboard(self, values: np.ndarray, k: int = 100) -> list[tuple[str, float]]:
+        """The top `k` players by `values`, as (UUID, value) pairs."""
+        return [(self.uuids[i], values[i].item()) for i in self.top_k(values, k)]
@@ -0,0 +1,140 @@
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class Freshness:
+    """How long a cached response for an endpoint may be served, in seconds.
+    Entries younger than `max_age` are served without a request. If a request fails,
+    entries up to `max_age + stale_if_error` old are served instead of raising.
+    """
+
+    max_age: float
+    stale_if_error: float = 0.0
+
+
+DEFAULT_FRESHNESS = {
+    "/player": Freshness(300, 3600),
+    "/skyblock/profile": Freshness(120, 3600),
+    "/skyblock/profiles": Freshness(120, 3600),
+}
+
+
+@dataclass
+class CacheEntry:
+    payload: dict[str, Any]
+    fetched_at: float
+
+    @property
+    def age(self):
+        return time.time() - self.fetched_at
+
+
+class SQLiteCache:
+    """A persistent cache of raw API responses, so restarted processes start warm.
+    The database runs in WAL mode, so several worker processes can read while one writes.
+    Only endpoints listed in `freshness` are cached. Once more than `max_entries` are stored,
+    the least recently fetched are evicted.
+
+    If another process holds the write lock for longer than `timeout` seconds, `get` treats it as a miss
+    and `put` skips the write, so a busy database never holds up a request for long.
+    The client runs these calls in a worker thread, so they don't block the event loop either.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        freshness: dict[str, Freshness] | None = None,
+        max_entries: int = 100_000,
+        timeout: float = 1.0,
+    ):
+        self.path = path
+        self.freshness = DEFAULT_FRESHNESS if freshness is None else freshness
+        self.max_entries = max_entries
+        self._puts = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            path, timeout=timeout, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS responses (
+                endpoint TEXT NOT NULL,
+                key TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                payload TEXT NOT NULL,
+                PRIMARY KEY (endpoint, key)
+            )"""
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_fetched_at ON responses (fetched_at)"
+        )
+
+    @staticmethod
+    def make_key(params: dict[str, Any] | None):
+        return json.dumps(params or {}, sort_keys=True, separators=(",", ":"))
+
+    def get(self, endpoint: str, params: dict[str, Any] | None = None) -> CacheEntry | None:
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT payload, fetched_at FROM responses WHERE endpoint = ? AND key = ?",
+                    (endpoint, self.make_key(params)),
+                ).fetchone()
+        except sqlite3.OperationalError:
+            # Busy or locked by another process.
+            return None
+        if row is None:
+            return None
+        return CacheEntry(json.loads(row[0]), row[1])
+
+    def put(self, endpoint: str, params: dict[str, Any] | None, payload: dict[str, Any]):
+        try:
+            with self._lock:
+                self._conn.execute(
+                    """INSERT INTO responses (endpoint, key, fetched_at, payload) VALUES (?, ?, ?, ?)
+                    ON CONFLICT (endpoint, key) DO UPDATE SET fetched_at = excluded.fetched_at, payload = excluded.payload""",
+                    (endpoint, self.make_key(params), time.time(), json.dumps(payload)),
+                )
+                self._puts += 1
+            # Counting rows is a full scan, so only check the bound every so often.
+            if self._puts % 256 == 0:
+                self.evict()
+        except sqlite3.OperationalError:
+            # Busy or locked by another process; the next fetch will try again.
+            pass
+
+    def evict(self):
+        """Drop the least recently fetched entries beyond `max_entries`."""
+        with self._lock:
+            self._conn.execute(
+                """DELETE FROM responses WHERE rowid IN (
+                    SELECT rowid FROM responses ORDER BY fetched_at DESC LIMIT -1 OFFSET ?
+                )""",
+                (self.max_entries,),
+            )
+
+    def purge_expired(self):
+        """Drop entries too old to be served by any freshness rule."""
+        now = time.time()
+        with self._lock:
+            for endpoint, rule in self.freshness.items():
+                self._conn.execute(
+                    "DELETE FROM responses WHERE endpoint = ? AND fetched_at < ?",
+                    (endpoint, now - rule.max_age - rule.stale_if_error),
+                )
+
+    def close(self):
+        try:
+            self.evict()
+        except sqlite3.OperationalError:
+            # Busy or locked by another process; eviction can wait for the next run.
+            pass
+        finally:
+            with self._lock:
+                self._conn.close()
@@ -1,5 +1,6 @@
 from enum import Enum, nonmember
 from abc import ABC, abstractmethod
+from importlib import import_module
 from typing import Self
 
 class Game(Enum):
@@ -40,8 +41,12 @@ class Game(Enum):
     WOOLGAMES = 68
     
     stat_classes: dict["Game", "Stats"] = nonmember({})
+    # Modules that register stat classes, imported the first time their game's stats are handled.
+    stat_modules: dict[str, str] = nonmember({"BEDWARS": "hypixel.bedwars"})
     
     def handle_json(self, json_data: dict):
+        if self not in self.stat_classes and self.name in self.stat_modules:
+            import_module(self.stat_modules[self.name])
         if self in self.stat_classes:
             return self.stat_classes[self].process_json(json_data)
         else:
@@ -1,9 +1,12 @@
-from aiohttp import ClientSession
+import asyncio
+from aiohttp import BaseConnector, ClientError, ClientSession, ClientTimeout, TCPConnector
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
+from .cache import SQLiteCache
 from .games import Game, Stats
-from .skyblock import profiles, bazaar, auctionhouse
+from .retry import RetryPolicy
+from .skyblock import profiles, bazaar, auctionhouse, filters
 
 if TYPE_CHECKING:
     from aiohttp import ClientResponse
@@ -13,12 +16,61 @@ class HypixelException(Exception):
     pass
 
 
-class Hypixel:
-    """The general class used to make API calls."""
+class ServerError(HypixelException):
+    """The API answered with a 5xx status."""
+
+
+API_URL = "https://api.hypixel.net"
+
 
-    def __init__(self, key: str):
+class Hypixel:
+    """The general class used to make API calls.
+    Pass `base_url` to point the client at something other than the public API, such as `hypixel.standin`.
+    Pass a `SQLiteCache` as `cache` to serve player and profile data from disk while it is fresh.
+
+    Several clients can share sockets by passing the same `session` or `connector`; these are not closed
+    by `close`. Otherwise the client creates its own connection pool, sized by `limit` (0 for no limit)
+    and `limit_per_host`, keeping idle connections open for `keepalive_timeout` seconds and caching DNS
+    lookups for `ttl_dns_cache` seconds. `timeout` applies to every request, whoever owns the session.
+
+    Pass a `RetryPolicy` as `retry` to retry transient failures and hedge slow requests.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        base_url: str = API_URL,
+        cache: SQLiteCache | None = None,
+        *,
+        session: ClientSession | None = None,
+        connector: BaseConnector | None = None,
+        timeout: ClientTimeout = ClientTimeout(total=5 * 60, sock_connect=30),
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 30.0,
+        ttl_dns_cache: int | None = 300,
+        retry: RetryPolicy | None = None,
+    ):
         self._key = key
-        self._session = ClientSession("https://api.hypixel.net")
+        self._base_url = base_url.rstrip("/")
+        self._cache = cache
+        self._timeout = timeout
+        self._retry = retry
+        self._owns_session = session is None
+        if session is not None:
+            self._session = session
+        else:
+            if connector is None:
+                connector = TCPConnector(
+                    limit=limit,
+                    limit_per_host=limit_per_host,
+                    keepalive_timeout=keepalive_timeout,
+                    ttl_dns_cache=ttl_dns_cache,
+                )
+                connector_owner = True
+            else:
+                connector_owner = False
+            self._session = ClientSession(connector=connector, connector_owner=connector_owner)
 
     @property
     def key(self):
@@ -29,87 +81,113 @@ class Hypixel:
 
     async def close(self):
         """Close the session, if you aren't using context managers."""
-        await self._session.close()
+        if self._owns_session:
+            await self._session.close()
 
     async def __aexit__(self, exc, exc_info, traceback):
         await self.close()
 
-    async def get_player(self, uuid) -> "Player":
-        """Get general data about a player given a UUID, along with game stats"""
+    async def _fetch(self, path: str, params: dict | None, keyed: bool) -> dict:
+        if self._retry is None:
+            return await self._fetch_once(path, params, keyed)
+        return await self._retry.run(
+            path,
+            lambda: self._fetch_once(path, params, keyed),
+            (ClientError, asyncio.TimeoutError, ServerError),
+        )
+
+    async def _fetch_once(self, path: str, params: dict | None, keyed: bool) -> dict:
+        headers = {"API-Key": self.key} if keyed else None
         async with self._session.get(
-            "/player", params={"uuid": uuid}, headers={"API-Key": self.key}
+            self._base_url + path, params=params, headers=headers, timeout=self._timeout
         ) as response:
             response: "ClientResponse"
+            if response.status >= 500:
+                raise ServerError(response.status, response.reason)
             data = await response.json()
             if not data["success"]:
                 raise HypixelException(response.status, data["cause"])
-            player = data["player"]
-
-            return Player(
-                uuid=player["uuid"],
-                display_name=player["displayname"],
-                rank=player["rank"]
-                if "rank" in player and player["rank"] != "NORMAL"
-                else player["monthlyPackageRank"]
-                if "monthlyPackageRank" in player
-                and player["monthlyPackageRank"] != None
-                else player["newPackageRank"]
-                if "newPackageRank" in player and player["newPackageRank"] != "NONE"
-                else player["packageRank"]
-                if "packageRank" in player and player["packageRank"] != "NONE"
-                else None,
-                first_login=datetime.fromtimestamp(
-                    player["firstLogin"] / 1000, timezone.utc
-                ),
-                last_login=datetime.fromtimestamp(
-                    player["lastLogin"] / 1000, timezone.utc
-                ),
-                last_logout=datetime.fromtimestamp(
-                    player["lastLogout"] / 1000, timezone.utc
-                ),
-                raw_stats=player["stats"],
-                stats=Game.handle_all_json(player["stats"]),
-            )
+            return data
+
+    async def _get(self, path: str, params: dict | None = None, keyed: bool = False) -> dict:
+        """Make a request, going through the cache if there is a freshness rule for `path`."""
+        rule = self._cache.freshness.get(path) if self._cache is not None else None
+        if rule is None:
+            return await self._fetch(path, params, keyed)
+        # SQLite calls block, so keep them off the event loop.
+        entry = await asyncio.to_thread(self._cache.get, path, params)
+        if entry is not None and entry.age <= rule.max_age:
+            return entry.payload
+        try:
+            data = await self._fetch(path, params, keyed)
+        except (HypixelException, ClientError, asyncio.TimeoutError):
+            if entry is not None and entry.age <= rule.max_age + rule.stale_if_error:
+                return entry.payload
+            raise
+        await asyncio.to_thread(self._cache.put, path, params, data)
+        return data
+
+    async def get_player(self, uuid) -> "Player":
+        """Get general data about a player given a UUID, along with game stats"""
+        data = await self._get("/player", {"uuid": uuid}, keyed=True)
+        player = data["player"]
+
+        return Player(
+            uuid=player["uuid"],
+            display_name=player["displayname"],
+            rank=player["rank"]
+            if "rank" in player and player["rank"] != "NORMAL"
+            else player["monthlyPackageRank"]
+            if "monthlyPackageRank" in player
+            and player["monthlyPackageRank"] != None
+            else player["newPackageRank"]
+            if "newPackageRank" in player and player["newPackageRank"] != "NONE"
+            else player["packageRank"]
+            if "packageRank" in player and player["packageRank"] != "NONE"
+            else None,
+            first_login=datetime.fromtimestamp(
+                player["firstLogin"] / 1000, timezone.utc
+            ),
+            last_login=datetime.fromtimestamp(
+                player["lastLogin"] / 1000, timezone.utc
+            ),
+            last_logout=datetime.fromtimestamp(
+                player["lastLogout"] / 1000, timezone.utc
+            ),
+            raw_stats=player["stats"],
+            stats=Game.handle_all_json(player["stats"]),
+        )
 
     async def get_skyblock_profile(self, profile_id) -> profiles.Profile:
         """Get skyblock data about a profile, given a profile ID."""
-        async with self._session.get(
-            "/skyblock/profile",
-            params={"profile": profile_id},
-            headers={"API-Key": self.key},
-        ) as r:
-            data = await r.json()
-            if not data["success"]:
-                raise HypixelException(r.status, data["cause"])
-            return profiles.Profile.process_json(data["profile"])
+        data = await self._get("/skyblock/profile", {"profile": profile_id}, keyed=True)
+        return profiles.Profile.process_json(data["profile"])
 
     async def get_skyblock_profiles(self, uuid) -> list[profiles.Profile]:
         """Get all the skyblock profiles of a player, given the UUID."""
-        async with self._session.get(
-            "/skyblock/profiles", params={"uuid": uuid}, headers={"API-Key": self.key}
-        ) as r:
-            data = await r.json()
-            if not data["success"]:
-                raise HypixelException(r.status, data["cause"])
-            return [profiles.Profile.process_json(i) for i in data["profiles"]]
+        data = await self._get("/skyblock/profiles", {"uuid": uuid}, keyed=True)
+        return [profiles.Profile.process_json(i) for i in data["profiles"]]
 
     async def get_bazaar_data(self) -> dict[str, bazaar.Product]:
         """Get the bazaar data."""
-        async with self._session.get("/skyblock/bazaar") as r:
-            data = await r.json()
-            if not data["success"]:
-                raise HypixelException(r.status, data["cause"])
-            return {
-                k: bazaar.Product.process_json(v) for k, v in data["products"].items()
-            }
-
-    async def get_auction_house_data(self, page=0) -> auctionhouse.AuctionHouse:
-        """Get all auctions on some page."""
-        async with self._session.get("/skyblock/auctions", params={"page": page}) as r:
-            data = await r.json()
-            if not data["success"]:
-                raise HypixelException(r.status, data["cause"])
-            return auctionhouse.AuctionHouse.process_json(data)
+        data = await self._get("/skyblock/bazaar")
+        return {k: bazaar.Product.process_json(v) for k, v in data["products"].items()}
+
+    async def get_auction_house_data(
+        self, page=0, auction_filter: filters.AuctionFilter | None = None
+    ) -> auctionhouse.AuctionHouse:
+        """Get all auctions on some page.
+        If `auction_filter` is given, each auction is checked against it as it is parsed.
+        """
+        data = await self._get("/skyblock/auctions", {"page": page})
+        return auctionhouse.AuctionHouse.process_json(
+            data, auction_filter.feed if auction_filter is not None else None
+        )
+
+    async def get_ended_auctions(self) -> list[auctionhouse.EndedAuction]:
+        """Get auctions that ended in the last 60 seconds."""
+        data = await self._get("/skyblock/auctions_ended")
+        return [auctionhouse.EndedAuction.process_json(i) for i in data["auctions"]]
 
 
 @dataclass(slots=True)
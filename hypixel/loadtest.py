@@ -0,0 +1,187 @@
+"""Drive a `Hypixel` client at high request rates and report throughput and tail latency.
+
+By default this starts a `hypixel.standin` server in-process; pass `--url` to target one running elsewhere.
+"""
+import argparse
+import asyncio
+import random
+import time
+import uuid as uuid_lib
+from dataclasses import dataclass, field
+from aiohttp import TCPConnector
+from .general import Hypixel, HypixelException
+from .retry import RetryPolicy
+from .standin import StandInConfig, StandInServer
+
+ENDPOINTS = {
+    "player": lambda client, rng, pages: client.get_player(uuid_lib.UUID(int=rng.getrandbits(128)).hex),
+    "profile": lambda client, rng, pages: client.get_skyblock_profile(uuid_lib.UUID(int=rng.getrandbits(128)).hex),
+    "profiles": lambda client, rng, pages: client.get_skyblock_profiles(uuid_lib.UUID(int=rng.getrandbits(128)).hex),
+    "bazaar": lambda client, rng, pages: client.get_bazaar_data(),
+    "auctions": lambda client, rng, pages: client.get_auction_house_data(rng.randrange(pages)),
+    "ended": lambda client, rng, pages: client.get_ended_auctions(),
+}
+
+
+@dataclass
+class LoadReport:
+    duration: float
+    latencies: list[float] = field(default_factory=list)
+    errors: dict[int | str, int] = field(default_factory=dict)
+
+    @property
+    def requests(self):
+        return len(self.latencies) + sum(self.errors.values())
+
+    @property
+    def throughput(self):
+        """Successful requests per second."""
+        return len(self.latencies) / self.duration if self.duration else 0.0
+
+    def percentile(self, q: float):
+        """Latency in seconds at percentile `q` (0-100) of successful requests."""
+        if not self.latencies:
+            return float("nan")
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))]
+
+    def __str__(self):
+        lines = [
+            f"requests:   {self.requests} in {self.duration:.2f}s",
+            f"throughput: {self.throughput:.1f} req/s",
+            "latency:    "
+            + "  ".join(f"p{q}={self.percentile(q) * 1000:.1f}ms" for q in [50, 90, 99, 99.9]),
+        ]
+        if self.errors:
+            lines.append("errors:     " + ", ".join(f"{k}: {v}" for k, v in self.errors.items()))
+        return "\n".join(lines)
+
+
+async def run_load(
+    client: Hypixel,
+    endpoints: list[str],
+    requests: int,
+    concurrency: int = 50,
+    seed: int = 0,
+    auction_pages: int = StandInConfig.auction_pages,
+) -> LoadReport:
+    """Make `requests` calls spread evenly over `endpoints`, with at most `concurrency` in flight.
+    Auction requests pick a random page below `auction_pages`, which must match the server's.
+    """
+    rng = random.Random(seed)
+    queue = [endpoints[i % len(endpoints)] for i in range(requests)]
+    report = LoadReport(duration=0.0)
+
+    async def worker():
+        while queue:
+            endpoint = queue.pop()
+            start = time.perf_counter()
+            try:
+                await ENDPOINTS[endpoint](client, rng, auction_pages)
+            except HypixelException as e:
+                report.errors[e.args[0]] = report.errors.get(e.args[0], 0) + 1
+            except Exception as e:
+                name = type(e).__name__
+                report.errors[name] = report.errors.get(name, 0) + 1
+            else:
+                report.latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    report.duration = time.perf_counter() - start
+    return report
+
+
+def _share(total: int, parts: int, index: int):
+    """Split `total` into `parts` near-equal shares, handing the remainder to the first ones."""
+    return total // parts + (index < total % parts)
+
+
+async def _run(args: argparse.Namespace, url: str):
+    endpoints = args.endpoints.split(",")
+    connector = TCPConnector(
+        limit=args.limit,
+        limit_per_host=args.limit_per_host,
+        force_close=not args.keepalive,
+    )
+    # Each client gets a share of the load; with --clients > 1 they all pool through one connector.
+    clients = [
+        Hypixel(
+            args.key,
+            base_url=url,
+            connector=connector,
+            retry=RetryPolicy(budget=args.retry_budget, hedge=args.hedge) if args.retry else None,
+        )
+        for _ in range(args.clients)
+    ]
+    try:
+        reports = await asyncio.gather(
+            *(
+                run_load(
+                    client,
+                    endpoints,
+                    _share(args.requests, len(clients), seed),
+                    max(1, _share(args.concurrency, len(clients), seed)),
+                    seed,
+                    args.auction_pages,
+                )
+                for seed, client in enumerate(clients)
+            )
+        )
+    finally:
+        for client in clients:
+            await client.close()
+        await connector.close()
+    report = LoadReport(duration=max(i.duration for i in reports))
+    for i in reports:
+        report.latencies.extend(i.latencies)
+        for k, v in i.errors.items():
+            report.errors[k] = report.errors.get(k, 0) + v
+    return report
+
+
+async def _main(args: argparse.Namespace):
+    if args.url:
+        return await _run(args, args.url)
+    config = StandInConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        rate_limit=args.rate_limit,
+        slow_rate=args.slow_rate,
+        error_rate=args.error_rate,
+        auction_pages=args.auction_pages,
+    )
+    async with StandInServer(config) as server:
+        return await _run(args, server.url)
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Load test a Hypixel client against a stand-in server.")
+    parser.add_argument("--url", help="base URL of a running stand-in; one is started in-process if omitted")
+    parser.add_argument("--key", default="load-test")
+    parser.add_argument("--endpoints", default="player,profiles,bazaar")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--clients", type=int, default=1, help="clients sharing one connector")
+    parser.add_argument("--limit", type=int, default=100, help="connection pool size, 0 for no limit")
+    parser.add_argument("--limit-per-host", type=int, default=0)
+    parser.add_argument("--no-keepalive", dest="keepalive", action="store_false")
+    parser.add_argument("--latency", type=float, default=StandInConfig.latency)
+    parser.add_argument("--jitter", type=float, default=StandInConfig.jitter)
+    parser.add_argument("--rate-limit", type=int, default=10**9)
+    parser.add_argument("--auction-pages", type=int, default=StandInConfig.auction_pages, help="must match the server's")
+    parser.add_argument("--slow-rate", type=float, default=StandInConfig.slow_rate)
+    parser.add_argument("--error-rate", type=float, default=StandInConfig.error_rate)
+    parser.add_argument("--retry", action="store_true", help="retry transient errors")
+    parser.add_argument("--retry-budget", type=float, default=RetryPolicy.budget)
+    parser.add_argument("--hedge", action="store_true", help="hedge slow requests (implies --retry)")
+    args = parser.parse_args(argv)
+    args.retry = args.retry or args.hedge
+    for endpoint in args.endpoints.split(","):
+        if endpoint not in ENDPOINTS:
+            parser.error(f"unknown endpoint {endpoint!r}, choose from {', '.join(ENDPOINTS)}")
+    print(asyncio.run(_main(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -37,7 +37,7 @@ def parse_int(data: bytes, index: int):
 
 
 def parse_long(data: bytes, index: int):
-    return (struct.unpack_from(">l", data, index)[0], index + 8)
+    return (struct.unpack_from(">q", data, index)[0], index + 8)
 
 
 def parse_float(data: bytes, index: int):
@@ -104,7 +104,7 @@ def parse_long_array(data: bytes, index: int):
     index += 4
     nums = []
     for _ in range(length):
-        nums.append(struct.unpack_from(">l", data, index)[0])
+        nums.append(struct.unpack_from(">q", data, index)[0])
         index += 8
     return (nums, index)
 
@@ -135,3 +135,64 @@ def parse_data(data: bytes):
     name = unzipped[3 : 3 + name_length].decode("utf-8")
     index = 3 + name_length
     return parse_compound(unzipped, index)[0]
+
+
+def tag_type_of(value) -> TagType:
+    if isinstance(value, bool):
+        return TagType.BYTE
+    if isinstance(value, int):
+        return TagType.INT if -(2**31) <= value < 2**31 else TagType.LONG
+    if isinstance(value, float):
+        return TagType.DOUBLE
+    if isinstance(value, str):
+        return TagType.STRING
+    if isinstance(value, (bytes, bytearray)):
+        return TagType.BYTE_ARRAY
+    if isinstance(value, list):
+        return TagType.LIST
+    if isinstance(value, dict):
+        return TagType.COMPOUND
+    raise TypeError(f"cannot encode {type(value).__name__} as NBT")
+
+
+def dump_string(value: str):
+    encoded = value.encode("utf-8")
+    return struct.pack(">H", len(encoded)) + encoded
+
+
+def dump_list(value: list):
+    tag_type = tag_type_of(value[0]) if value else TagType.END
+    return struct.pack(">bi", tag_type.value, len(value)) + b"".join(
+        dumpers[tag_type](i) for i in value
+    )
+
+
+def dump_compound(value: dict):
+    parts = []
+    for name, tag in value.items():
+        tag_type = tag_type_of(tag)
+        parts.append(struct.pack(">b", tag_type.value))
+        parts.append(dump_string(name))
+        parts.append(dumpers[tag_type](tag))
+    parts.append(struct.pack(">b", TagType.END.value))
+    return b"".join(parts)
+
+
+dumpers = {
+    TagType.BYTE: lambda value: struct.pack("b", value),
+    TagType.INT: lambda value: struct.pack(">i", value),
+    TagType.LONG: lambda value: struct.pack(">q", value),
+    TagType.DOUBLE: lambda value: struct.pack(">d", value),
+    TagType.BYTE_ARRAY: lambda value: struct.pack(">i", len(value)) + bytes(value),
+    TagType.STRING: dump_string,
+    TagType.LIST: dump_list,
+    TagType.COMPOUND: dump_compound,
+}
+
+
+def dump_data(data: dict, name: str = "") -> bytes:
+    """Encode a compound the same way the API encodes `item_bytes`.
+    Python types are mapped to the narrowest matching tag, so this round-trips through `parse_data`.
+    """
+    raw = struct.pack(">B", TagType.COMPOUND.value) + dump_string(name) + dump_compound(data)
+    return base64.b64encode(gzip.compress(raw))
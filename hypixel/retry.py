@@ -0,0 +1,151 @@
+import asyncio
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+class LatencyTracker:
+    """Keeps the latest `window` request latencies per endpoint, in seconds."""
+
+    def __init__(self, window: int = 256):
+        self.window = window
+        self._samples: dict[str, deque[float]] = {}
+
+    def record(self, endpoint: str, seconds: float):
+        samples = self._samples.get(endpoint)
+        if samples is None:
+            samples = self._samples[endpoint] = deque(maxlen=self.window)
+        samples.append(seconds)
+
+    def samples(self, endpoint: str):
+        return len(self._samples.get(endpoint, ()))
+
+    def percentile(self, endpoint: str, q: float) -> float | None:
+        """Latency at percentile `q` (0-100) for an endpoint, or None if nothing has been recorded."""
+        samples = self._samples.get(endpoint)
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))]
+
+
+@dataclass
+class RetryBudget:
+    """Limits retries and hedges to a share of requests.
+    Each request deposits `ratio` tokens, up to `max_tokens`, and each retry or hedge spends one.
+    The bucket starts full, as in gRPC retry throttling, so a fresh client can retry straight away;
+    after a burst of `max_tokens` retries, they are limited to the `ratio` share.
+    """
+
+    ratio: float = 0.1
+    max_tokens: float = 10.0
+    tokens: float | None = None
+
+    def __post_init__(self):
+        if self.tokens is None:
+            self.tokens = self.max_tokens
+
+    def deposit(self):
+        self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+@dataclass
+class RetryPolicy:
+    """Retries and request hedging for `Hypixel`.
+
+    Failed requests with a transient error are retried up to `attempts` times in total, after a
+    random delay of up to `base_delay * 2**n` seconds (capped at `max_delay`).
+
+    With `hedge` on, once an endpoint has `min_samples` latencies recorded, a request still running
+    after the `hedge_percentile` latency for its endpoint gets a second identical request, and
+    whichever finishes first is used.
+
+    Retries and hedges both cost quota, so together they are limited to `budget` times the number of requests,
+    plus an initial allowance of 10 so short-lived clients can retry too.
+    """
+
+    attempts: int = 3
+    base_delay: float = 0.1
+    max_delay: float = 2.0
+    budget: float = 0.1
+    hedge: bool = False
+    hedge_percentile: float = 95.0
+    hedge_min_delay: float = 0.05
+    min_samples: int = 20
+    latencies: LatencyTracker = field(default_factory=LatencyTracker)
+    retries: int = field(default=0, init=False)
+    hedges: int = field(default=0, init=False)
+    _budget: RetryBudget = field(init=False, repr=False)
+
+    def __post_init__(self):
+        if self.attempts < 1:
+            raise ValueError("attempts must be at least 1")
+        self._budget = RetryBudget(self.budget)
+
+    def backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+    def hedge_delay(self, endpoint: str) -> float | None:
+        if not self.hedge or self.latencies.samples(endpoint) < self.min_samples:
+            return None
+        return max(self.hedge_min_delay, self.latencies.percentile(endpoint, self.hedge_percentile))
+
+    async def run(
+        self,
+        endpoint: str,
+        make_request: Callable[[], Awaitable[T]],
+        transient: tuple[type[BaseException], ...],
+    ) -> T:
+        """Run a request, retrying it if it fails with one of the `transient` exceptions."""
+        self._budget.deposit()
+        for attempt in range(self.attempts):
+            try:
+                return await self._attempt(endpoint, make_request)
+            except transient:
+                if attempt == self.attempts - 1 or not self._budget.withdraw():
+                    raise
+                self.retries += 1
+            await asyncio.sleep(self.backoff(attempt))
+
+    async def _timed(self, endpoint: str, make_request: Callable[[], Awaitable[T]]) -> T:
+        start = time.perf_counter()
+        try:
+            result = await make_request()
+        except asyncio.CancelledError:
+            # Usually a slow request that lost to its hedge. It took at least this long, and leaving
+            # it out would drag the percentile down until hedges fire on every request.
+            self.latencies.record(endpoint, time.perf_counter() - start)
+            raise
+        self.latencies.record(endpoint, time.perf_counter() - start)
+        return result
+
+    async def _attempt(self, endpoint: str, make_request: Callable[[], Awaitable[T]]) -> T:
+        delay = self.hedge_delay(endpoint)
+        pending = {asyncio.ensure_future(self._timed(endpoint, make_request))}
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait(pending, timeout=delay)
+                if not done and self._budget.withdraw():
+                    self.hedges += 1
+                    pending.add(asyncio.ensure_future(self._timed(endpoint, make_request)))
+            error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Any, Callable
 from ..nbt import parse_data
 
 
@@ -12,13 +13,24 @@ class AuctionHouse:
     auctions: list["Auction"]
 
     @classmethod
-    def process_json(cls: type["AuctionHouse"], json_data: dict):
+    def process_json(
+        cls: type["AuctionHouse"],
+        json_data: dict,
+        on_auction: Callable[["Auction"], Any] | None = None,
+    ):
+        """`on_auction` is called with each auction as soon as it is parsed."""
+        auctions = []
+        for i in json_data["auctions"]:
+            auction = Auction.process_json(i)
+            if on_auction is not None:
+                on_auction(auction)
+            auctions.append(auction)
         return cls(
             page=json_data["page"],
             total_pages=json_data["totalPages"],
             total_auctions=json_data["totalAuctions"],
             last_updated=datetime.fromtimestamp(json_data["lastUpdated"] / 1000),
-            auctions=[Auction.process_json(i) for i in json_data["auctions"]],
+            auctions=auctions,
         )
 
 
@@ -41,6 +53,7 @@ class Auction:
     claimed_bidders: list
     highest_bid_amount: int
     bids: list["Bid"]
+    bin: bool = False
 
     @classmethod
     def process_json(cls: type["Auction"], json_data: dict):
@@ -62,8 +75,23 @@ class Auction:
             claimed_bidders=json_data["claimed_bidders"],
             highest_bid_amount=json_data["highest_bid_amount"],
             bids=[Bid.process_json(i) for i in json_data["bids"]],
+            bin=json_data.get("bin", False),
         )
 
+    @property
+    def extra_attributes(self) -> dict:
+        """The item's `ExtraAttributes` compound, which holds its skyblock ID, enchantments, reforge and so on."""
+        return extra_attributes(self.item_data)
+
+    @property
+    def item_id(self) -> str | None:
+        return self.extra_attributes.get("id")
+
+    @property
+    def price(self) -> int:
+        """The current price: the highest bid if there is one, otherwise the starting bid."""
+        return self.highest_bid_amount or self.starting_bid
+
 
 @dataclass
 class Bid:
@@ -75,10 +103,50 @@ class Bid:
 
     @classmethod
     def process_json(cls: type["Bid"], json_data):
-        cls(
+        return cls(
             auction_id=json_data["auction_id"],
             bidder=json_data["bidder"],
             profile_id=json_data["profile_id"],
             amount=json_data["amount"],
-            timestamp=json_data["timestamp"],
+            timestamp=datetime.fromtimestamp(json_data["timestamp"] / 1000),
+        )
+
+
+@dataclass
+class EndedAuction:
+    auction_id: str
+    seller: str
+    seller_profile: str
+    buyer: str
+    timestamp: datetime
+    price: int
+    bin: bool
+    item_data: dict
+
+    @classmethod
+    def process_json(cls: type["EndedAuction"], json_data):
+        return cls(
+            auction_id=json_data["auction_id"],
+            seller=json_data["seller"],
+            seller_profile=json_data["seller_profile"],
+            buyer=json_data["buyer"],
+            timestamp=datetime.fromtimestamp(json_data["timestamp"] / 1000),
+            price=json_data["price"],
+            bin=json_data.get("bin", False),
+            item_data=parse_data(json_data["item_bytes"].encode("ascii")),
         )
+
+    @property
+    def extra_attributes(self) -> dict:
+        return extra_attributes(self.item_data)
+
+    @property
+    def item_id(self) -> str | None:
+        return self.extra_attributes.get("id")
+
+
+def extra_attributes(item_data: dict) -> dict:
+    try:
+        return item_data["i"][0]["tag"]["ExtraAttributes"]
+    except (KeyError, IndexError):
+        return {}
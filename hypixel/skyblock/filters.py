@@ -0,0 +1,259 @@
+"""Declarative watch rules for auctions, compiled into a single matcher.
+
+Rules are indexed by item ID and their conditions are deduplicated, so an auction is only checked
+against the rules for its item, and a condition shared by many rules is evaluated once per auction.
+"""
+import re
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from operator import eq, ge, gt, le, lt, ne
+from typing import Any, Callable
+from .auctionhouse import Auction
+
+Subscriber = Callable[["Rule", Auction], Any]
+
+_OPERATORS = {"==": eq, "!=": ne, "<": lt, "<=": le, ">": gt, ">=": ge}
+_MISSING = object()
+
+
+class Condition(ABC):
+    """A test on one auction. Conditions compare equal when they test the same thing, so they can be shared."""
+
+    # Rough relative cost, so cheap conditions are checked first.
+    cost = 1
+
+    @abstractmethod
+    def test(self, auction: Auction) -> bool: ...
+
+
+@dataclass(frozen=True)
+class PriceRange(Condition):
+    min_price: int | None = None
+    max_price: int | None = None
+
+    def test(self, auction: Auction):
+        price = auction.price
+        return (self.min_price is None or price >= self.min_price) and (
+            self.max_price is None or price <= self.max_price
+        )
+
+
+@dataclass(frozen=True)
+class TierIn(Condition):
+    tiers: frozenset[str]
+
+    def test(self, auction: Auction):
+        return auction.tier in self.tiers
+
+
+@dataclass(frozen=True)
+class CategoryIn(Condition):
+    categories: frozenset[str]
+
+    def test(self, auction: Auction):
+        return auction.category in self.categories
+
+
+@dataclass(frozen=True)
+class IsBin(Condition):
+    bin: bool = True
+
+    def test(self, auction: Auction):
+        return auction.bin == self.bin
+
+
+@dataclass(frozen=True)
+class Attribute(Condition):
+    """Compares a value in the item's `ExtraAttributes`, found by following `path`.
+    `op` is one of `==`, `!=`, `<`, `<=`, `>`, `>=`, `in` (the value is in the attribute),
+    or `exists` (the attribute is present; `value` is ignored).
+    A missing attribute, or one that can't be compared with `value`, fails the condition.
+    Lists in `value` are stored as tuples and sets as frozensets, so conditions stay hashable.
+    """
+
+    path: tuple[str, ...]
+    op: str = "exists"
+    value: Any = None
+    cost = 2
+
+    def __post_init__(self):
+        if isinstance(self.path, str):
+            object.__setattr__(self, "path", tuple(self.path.split(".")))
+        if self.op not in _OPERATORS and self.op not in ("in", "exists"):
+            raise ValueError(f"unknown operator {self.op!r}")
+        if isinstance(self.value, list):
+            object.__setattr__(self, "value", tuple(self.value))
+        elif isinstance(self.value, set):
+            object.__setattr__(self, "value", frozenset(self.value))
+        try:
+            hash(self.value)
+        except TypeError:
+            raise ValueError(f"attribute value must be hashable, not {type(self.value).__name__}") from None
+
+    def test(self, auction: Auction):
+        value = auction.extra_attributes
+        for key in self.path:
+            if not isinstance(value, dict):
+                return False
+            value = value.get(key, _MISSING)
+            if value is _MISSING:
+                return False
+        if self.op == "exists":
+            return True
+        try:
+            if self.op == "in":
+                return self.value in value
+            if isinstance(value, list) and isinstance(self.value, tuple):
+                value = tuple(value)
+            return _OPERATORS[self.op](value, self.value)
+        except TypeError:
+            return False
+
+
+@dataclass(frozen=True)
+class LoreMatches(Condition):
+    pattern: str
+    _regex: re.Pattern = field(init=False, repr=False, compare=False, hash=False)
+    cost = 3
+
+    def __post_init__(self):
+        object.__setattr__(self, "_regex", re.compile(self.pattern))
+
+    def test(self, auction: Auction):
+        return self._regex.search(auction.item_lore) is not None
+
+
+@dataclass(frozen=True)
+class Rule:
+    """A watch rule. Every given criterion must hold for an auction to match.
+    `item_id` is the skyblock ID from the item's `ExtraAttributes`; rules without one are checked against every auction.
+    `tiers` and `categories` take a single name or any collection of names.
+    """
+
+    name: str
+    item_id: str | None = None
+    min_price: int | None = None
+    max_price: int | None = None
+    tiers: frozenset[str] | None = None
+    categories: frozenset[str] | None = None
+    bin: bool | None = None
+    attributes: tuple[Attribute, ...] = ()
+    lore: str | None = None
+
+    def __post_init__(self):
+        for name in ("tiers", "categories"):
+            value = getattr(self, name)
+            if isinstance(value, str):
+                object.__setattr__(self, name, frozenset([value]))
+            elif value is not None and not isinstance(value, frozenset):
+                object.__setattr__(self, name, frozenset(value))
+        object.__setattr__(self, "attributes", tuple(self.attributes))
+
+    def conditions(self) -> list[Condition]:
+        conditions = []
+        if self.min_price is not None or self.max_price is not None:
+            conditions.append(PriceRange(self.min_price, self.max_price))
+        if self.tiers is not None:
+            conditions.append(TierIn(self.tiers))
+        if self.categories is not None:
+            conditions.append(CategoryIn(self.categories))
+        if self.bin is not None:
+            conditions.append(IsBin(self.bin))
+        conditions.extend(self.attributes)
+        if self.lore is not None:
+            conditions.append(LoreMatches(self.lore))
+        return sorted(conditions, key=lambda i: i.cost)
+
+
+@dataclass
+class _Compiled:
+    conditions: list[Condition]
+    # Rules for each item ID, as (rule, indices into conditions); None holds rules for any item.
+    by_item: dict[str | None, list[tuple[Rule, tuple[int, ...]]]]
+
+
+class AuctionFilter:
+    """A set of watch rules, with subscribers notified when an auction matches.
+    Pass `feed` as `on_auction` to `AuctionHouse.process_json`, or pass the filter to
+    `Hypixel.get_auction_house_data`, to check auctions as they are parsed.
+    """
+
+    def __init__(self, rules: list[Rule] | None = None):
+        self._rules: dict[str, Rule] = {}
+        self._subscribers: dict[str | None, list[Subscriber]] = {}
+        self._compiled: _Compiled | None = None
+        for rule in rules or []:
+            self.add(rule)
+
+    @property
+    def rules(self):
+        return list(self._rules.values())
+
+    def add(self, rule: Rule, subscriber: Subscriber | None = None):
+        """Add a rule, replacing any with the same name, and optionally subscribe to it."""
+        self._rules[rule.name] = rule
+        self._compiled = None
+        if subscriber is not None:
+            self.subscribe(subscriber, rule.name)
+
+    def remove(self, name: str):
+        del self._rules[name]
+        self._subscribers.pop(name, None)
+        self._compiled = None
+
+    def subscribe(self, subscriber: Subscriber, name: str | None = None):
+        """Call `subscriber(rule, auction)` on matches of the rule called `name`, or of every rule if `name` is None."""
+        self._subscribers.setdefault(name, []).append(subscriber)
+
+    def compile(self):
+        """Build the matcher. This happens automatically on the first match after rules change."""
+        conditions: list[Condition] = []
+        indices: dict[Condition, int] = {}
+        by_item: dict[str | None, list[tuple[Rule, tuple[int, ...]]]] = {}
+        for rule in self._rules.values():
+            rule_indices = []
+            for condition in rule.conditions():
+                if condition not in indices:
+                    indices[condition] = len(conditions)
+                    conditions.append(condition)
+                rule_indices.append(indices[condition])
+            by_item.setdefault(rule.item_id, []).append((rule, tuple(rule_indices)))
+        self._compiled = _Compiled(conditions, by_item)
+        return self._compiled
+
+    def match(self, auction: Auction) -> list[Rule]:
+        """Get the rules an auction matches, without notifying subscribers."""
+        compiled = self._compiled or self.compile()
+        conditions = compiled.conditions
+        results: dict[int, bool] = {}
+        matches = []
+        # Auctions without an item ID only have the any-item rules to check, so don't check those twice.
+        buckets = [compiled.by_item.get(None)]
+        if auction.item_id is not None:
+            buckets.insert(0, compiled.by_item.get(auction.item_id))
+        for candidates in buckets:
+            if not candidates:
+                continue
+            for rule, rule_indices in candidates:
+                for i in rule_indices:
+                    result = results.get(i)
+                    if result is None:
+                        result = results[i] = conditions[i].test(auction)
+                    if not result:
+                        break
+                else:
+                    matches.append(rule)
+        return matches
+
+    def feed(self, auction: Auction) -> list[Rule]:
+        """Match an auction and notify subscribers of each matching rule."""
+        matches = self.match(auction)
+        catch_all = self._subscribers.get(None, ())
+        for rule in matches:
+            for subscriber in self._subscribers.get(rule.name, ()):
+                subscriber(rule, auction)
+            for subscriber in catch_all:
+                subscriber(rule, auction)
+        return matches
+
+    __call__ = feed
@@ -1,7 +1,8 @@
 from enum import Enum, auto
 from dataclasses import dataclass, field
 from operator import getitem
-from functools import partial
+from functools import cache, partial
+from pathlib import Path
 import json
 
 
@@ -120,11 +121,19 @@ class Item:
     def handle_json(cls: type["Item"], json_data: dict):
         return cls(**json_data)
 
-with open("c:\\Users\\jayhu\\hypixel-stuff\\hypixelapi\\skyblock\\items.json") as f:
-    json_data = json.load(f)
-    items = {k: Item(**v) for k, v in json_data.items()}
+@cache
+def load_items() -> dict[str, Item]:
+    """Load the item catalog. It is only read on first use, since parsing it is slow."""
+    with open(Path(__file__).with_name("items.json"), encoding="utf-8") as f:
+        return {k: Item(**v) for k, v in json.load(f).items()}
+
+def __getattr__(name: str):
+    if name == "items":
+        return load_items()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def from_name(name: str):
+    items = load_items()
     if name.upper().replace(" ", "_") in items:
         return items[name.upper().replace(" ", "_")]
     else:
@@ -0,0 +1,255 @@
+"""Bounded-memory price statistics per item, built from sold auctions.
+
+Each item keeps a quantile sketch and an exponentially decayed average, both of fixed size,
+so memory doesn't grow with the number of sales. Everything can be serialised with `to_dict`
+and combined with `merge`, so several crawler processes can each keep a shard and combine them later.
+"""
+import math
+from dataclasses import dataclass, field
+from datetime import datetime
+from .auctionhouse import Auction, EndedAuction
+
+
+class QuantileSketch:
+    """A mergeable quantile sketch with relative error (DDSketch).
+    Values are counted in logarithmic buckets, so any quantile is within `relative_accuracy` of the true value.
+    At most `max_bins` buckets are kept; beyond that the lowest are folded together, losing accuracy only at the bottom.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, max_bins: int = 512):
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.bins: dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def add(self, value: float, count: int = 1):
+        if value <= 0:
+            self.zero_count += count
+        else:
+            key = math.ceil(math.log(value) / self._log_gamma)
+            self.bins[key] = self.bins.get(key, 0) + count
+            if len(self.bins) > self.max_bins:
+                self._collapse()
+        self.count += count
+
+    def _collapse(self):
+        keys = sorted(self.bins)
+        excess = len(keys) - self.max_bins
+        target = keys[excess]
+        for key in keys[:excess]:
+            self.bins[target] += self.bins.pop(key)
+
+    def quantile(self, q: float) -> float | None:
+        """The value at quantile `q` (0-1), or None if nothing has been added."""
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        for key in sorted(self.bins):
+            seen += self.bins[key]
+            if rank < seen:
+                return 2 * self.gamma**key / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.bins) / (self.gamma + 1)
+
+    def merge(self, other: "QuantileSketch"):
+        if other.gamma != self.gamma:
+            raise ValueError("cannot merge sketches with different accuracy")
+        for key, count in other.bins.items():
+            self.bins[key] = self.bins.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        if len(self.bins) > self.max_bins:
+            self._collapse()
+
+    def to_dict(self):
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "max_bins": self.max_bins,
+            "bins": {str(k): v for k, v in self.bins.items()},
+            "zero_count": self.zero_count,
+        }
+
+    @classmethod
+    def from_dict(cls, json_data: dict):
+        sketch = cls(json_data["relative_accuracy"], json_data["max_bins"])
+        sketch.bins = {int(k): v for k, v in json_data["bins"].items()}
+        sketch.zero_count = json_data["zero_count"]
+        sketch.count = sketch.zero_count + sum(sketch.bins.values())
+        return sketch
+
+
+@dataclass
+class DecayedAverage:
+    """An exponentially decayed average: a sale's weight halves every `half_life` seconds."""
+
+    half_life: float
+    total: float = 0.0
+    weight: float = 0.0
+    timestamp: float = 0.0
+
+    def _decay(self, seconds: float):
+        return 0.5 ** (seconds / self.half_life)
+
+    def add(self, value: float, timestamp: float):
+        if timestamp >= self.timestamp:
+            factor = self._decay(timestamp - self.timestamp)
+            self.total = self.total * factor + value
+            self.weight = self.weight * factor + 1
+            self.timestamp = timestamp
+        else:
+            factor = self._decay(self.timestamp - timestamp)
+            self.total += value * factor
+            self.weight += factor
+
+    @property
+    def value(self) -> float | None:
+        return self.total / self.weight if self.weight else None
+
+    def merge(self, other: "DecayedAverage"):
+        if other.half_life != self.half_life:
+            raise ValueError("cannot merge averages with different half lives")
+        timestamp = max(self.timestamp, other.timestamp)
+        mine = self._decay(timestamp - self.timestamp)
+        theirs = self._decay(timestamp - other.timestamp)
+        self.total = self.total * mine + other.total * theirs
+        self.weight = self.weight * mine + other.weight * theirs
+        self.timestamp = timestamp
+
+
+@dataclass
+class ItemPrices:
+    sketch: QuantileSketch
+    average: DecayedAverage
+    last_sold: float = 0.0
+
+    @property
+    def sales(self):
+        return self.sketch.count
+
+    @property
+    def median(self):
+        return self.sketch.quantile(0.5)
+
+    def quantile(self, q: float):
+        return self.sketch.quantile(q)
+
+    def merge(self, other: "ItemPrices"):
+        self.sketch.merge(other.sketch)
+        self.average.merge(other.average)
+        self.last_sold = max(self.last_sold, other.last_sold)
+
+    def to_dict(self):
+        return {
+            "sketch": self.sketch.to_dict(),
+            "average": {
+                "total": self.average.total,
+                "weight": self.average.weight,
+                "timestamp": self.average.timestamp,
+            },
+            "last_sold": self.last_sold,
+        }
+
+
+@dataclass
+class PriceStats:
+    """Price statistics per skyblock item ID, fed by sold auctions.
+    Prices are per unit, so a stack of 64 selling for 640 coins records a price of 10.
+    """
+
+    relative_accuracy: float = 0.01
+    max_bins: int = 512
+    half_life: float = 24 * 60 * 60
+    items: dict[str, ItemPrices] = field(default_factory=dict)
+
+    def __getitem__(self, item_id: str) -> ItemPrices:
+        return self.items[item_id]
+
+    def __contains__(self, item_id: str):
+        return item_id in self.items
+
+    def _new(self):
+        return ItemPrices(QuantileSketch(self.relative_accuracy, self.max_bins), DecayedAverage(self.half_life))
+
+    def add(self, item_id: str, price: float, timestamp: datetime | float):
+        if isinstance(timestamp, datetime):
+            timestamp = timestamp.timestamp()
+        item = self.items.get(item_id)
+        if item is None:
+            item = self.items[item_id] = self._new()
+        item.sketch.add(price)
+        item.average.add(price, timestamp)
+        item.last_sold = max(item.last_sold, timestamp)
+
+    def add_ended_auction(self, auction: EndedAuction, since: datetime | None = None) -> bool:
+        """Record a sold auction. Each sale must only be recorded once; the ended auctions endpoint
+        covers the last 60 seconds, so when polling more often than that pass the previous poll's
+        time as `since` to skip sales that were already seen. Returns whether it was recorded.
+        """
+        if auction.item_id is None:
+            return False
+        if since is not None and auction.timestamp <= since:
+            return False
+        self.add(auction.item_id, auction.price / _stack_size(auction.item_data), auction.timestamp)
+        return True
+
+    def add_auction(
+        self, auction: Auction, now: datetime | None = None, since: datetime | None = None
+    ) -> bool:
+        """Record an auction from the auction house if it has ended with a winning bid.
+        Ended auctions stay listed until claimed, so the same one shows up in several crawls.
+        Pass the previous crawl's `now` as `since` to only record auctions that ended after it.
+        Returns whether it was recorded.
+        """
+        if auction.item_id is None or not auction.bids:
+            return False
+        if auction.end > (now or datetime.now()):
+            return False
+        if since is not None and auction.end <= since:
+            return False
+        winning = max(auction.bids, key=lambda i: i.amount)
+        self.add(auction.item_id, winning.amount / _stack_size(auction.item_data), winning.timestamp)
+        return True
+
+    def merge(self, other: "PriceStats"):
+        # Check up front, so a mismatched shard doesn't leave this one half merged.
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("cannot merge price stats with different accuracy")
+        if other.half_life != self.half_life:
+            raise ValueError("cannot merge price stats with different half lives")
+        for item_id, prices in other.items.items():
+            if item_id in self.items:
+                self.items[item_id].merge(prices)
+            else:
+                self.items[item_id] = self._new()
+                self.items[item_id].merge(prices)
+
+    def to_dict(self):
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "max_bins": self.max_bins,
+            "half_life": self.half_life,
+            "items": {k: v.to_dict() for k, v in self.items.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, json_data: dict):
+        stats = cls(json_data["relative_accuracy"], json_data["max_bins"], json_data["half_life"])
+        for item_id, item in json_data["items"].items():
+            stats.items[item_id] = ItemPrices(
+                QuantileSketch.from_dict(item["sketch"]),
+                DecayedAverage(stats.half_life, **item["average"]),
+                item["last_sold"],
+            )
+        return stats
+
+
+def _stack_size(item_data: dict) -> int:
+    try:
+        return item_data["i"][0]["Count"] or 1
+    except (KeyError, IndexError):
+        return 1
@@ -0,0 +1,461 @@
+"""A local stand-in for the Hypixel API, for load testing without touching the real thing.
+
+Run it with `python -m hypixel.standin`, then point a client at it with `Hypixel(key, base_url=...)`.
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+import uuid as uuid_lib
+from dataclasses import dataclass
+from aiohttp import web
+from .nbt import dump_data
+
+TIERS = ["COMMON", "UNCOMMON", "RARE", "EPIC", "LEGENDARY", "MYTHIC"]
+ITEMS = [
+    ("ASPECT_OF_THE_END", "Aspect of the End", 276, "weapon"),
+    ("HYPERION", "Hyperion", 267, "weapon"),
+    ("TERMINATOR", "Terminator", 261, "weapon"),
+    ("JUJU_SHORTBOW", "Juju Shortbow", 261, "weapon"),
+    ("NECRON_CHESTPLATE", "Necron's Chestplate", 299, "armor"),
+    ("STORM_HELMET", "Storm's Helmet", 397, "armor"),
+    ("SHADOW_ASSASSIN_BOOTS", "Shadow Assassin Boots", 301, "armor"),
+    ("TALISMAN_OF_POWER", "Talisman of Power", 397, "accessories"),
+    ("ENCHANTED_DIAMOND", "Enchanted Diamond", 264, "misc"),
+    ("ENCHANTED_BOOK", "Enchanted Book", 403, "misc"),
+    ("GOD_POTION_2", "God Potion", 373, "consumables"),
+    ("ENCHANTED_OBSIDIAN", "Enchanted Obsidian", 49, "blocks"),
+]
+REFORGES = ["heroic", "spicy", "withered", "fabled", "ancient", "necrotic", "renowned"]
+ENCHANTMENTS = ["sharpness", "critical", "ender_slayer", "growth", "protection", "ultimate_wise", "power"]
+# The most auctions the ended auctions endpoint returns; it covers the last 60 seconds.
+ENDED_AUCTIONS = 1500
+BAZAAR_PRODUCTS = ["ENCHANTED_DIAMOND", "ENCHANTED_OBSIDIAN", "WHEAT", "ENCHANTED_BREAD", "COAL", "ENCHANTED_COAL"]
+
+
+@dataclass
+class StandInConfig:
+    """Settings for the stand-in server.
+    Every response is delayed by `latency` plus a uniformly random amount up to `jitter`, in seconds.
+    Each API key may make `rate_limit` keyed requests per `rate_window` seconds before getting 429s.
+    Responses are gzipped for clients that accept it unless `compress` is off.
+    To emulate a long tail, a share `slow_rate` of responses take `slow_latency` seconds instead,
+    and a share `error_rate` fail with a 503.
+    """
+
+    latency: float = 0.05
+    jitter: float = 0.02
+    rate_limit: int = 300
+    rate_window: float = 300.0
+    auction_pages: int = 5
+    auctions_per_page: int = 1000
+    bazaar_products: int = 200
+    seed: int = 0
+    compress: bool = True
+    slow_rate: float = 0.0
+    slow_latency: float = 2.0
+    error_rate: float = 0.0
+
+
+@dataclass
+class _RateWindow:
+    start: float
+    used: int = 0
+
+
+def _uuid(rng: random.Random):
+    return uuid_lib.UUID(int=rng.getrandbits(128), version=4).hex
+
+
+def generate_item_bytes(rng: random.Random, item_id: str, name: str, material: int, tier: str):
+    enchantments = {i: rng.randint(1, 7) for i in rng.sample(ENCHANTMENTS, rng.randint(0, 4))}
+    extra = {
+        "id": item_id,
+        "uuid": str(uuid_lib.UUID(int=rng.getrandbits(128), version=4)),
+        "timestamp": int(time.time() * 1000) - rng.randint(0, 10**10),
+    }
+    if enchantments:
+        extra["enchantments"] = enchantments
+    if rng.random() < 0.5:
+        extra["modifier"] = rng.choice(REFORGES)
+    if rng.random() < 0.3:
+        extra["hot_potato_count"] = rng.randint(1, 15)
+    if rng.random() < 0.2:
+        extra["rarity_upgrades"] = 1
+    lore = [f"§7{k.replace('_', ' ').title()} {v}" for k, v in enchantments.items()]
+    lore.append(f"§l{tier}")
+    item = {
+        "id": material,
+        "Count": 1,
+        "tag": {"ExtraAttributes": extra, "display": {"Name": name, "Lore": lore}},
+        "Damage": 0,
+    }
+    return dump_data({"i": [item]}).decode("ascii"), "\n".join(lore)
+
+
+def generate_auction(rng: random.Random, now: int):
+    item_id, name, material, category = rng.choice(ITEMS)
+    tier = rng.choice(TIERS)
+    item_bytes, lore = generate_item_bytes(rng, item_id, name, material, tier)
+    start = now - rng.randint(0, 86_400_000)
+    starting_bid = rng.randint(1, 50_000) * 100
+    auction_id = _uuid(rng)
+    is_bin = rng.random() < 0.7
+    bids = []
+    amount = starting_bid
+    if not is_bin:
+        for _ in range(rng.randint(0, 5)):
+            amount = int(amount * rng.uniform(1.05, 1.5))
+            bids.append(
+                {
+                    "auction_id": auction_id,
+                    "bidder": _uuid(rng),
+                    "profile_id": _uuid(rng),
+                    "amount": amount,
+                    "timestamp": rng.randint(start, now),
+                }
+            )
+    return {
+        "uuid": auction_id,
+        "auctioneer": _uuid(rng),
+        "profile_id": _uuid(rng),
+        "coop": [],
+        "start": start,
+        "end": start + rng.choice([1, 6, 12, 24, 48]) * 3_600_000,
+        "item_name": name,
+        "item_lore": lore,
+        "extra": f"{name} {item_id}",
+        "category": category,
+        "tier": tier,
+        "starting_bid": starting_bid,
+        "item_bytes": item_bytes,
+        "claimed": False,
+        "claimed_bidders": [],
+        "highest_bid_amount": bids[-1]["amount"] if bids else 0,
+        "bin": is_bin,
+        "bids": bids,
+    }
+
+
+def generate_ended_auction(rng: random.Random, now: int):
+    auction = generate_auction(rng, now)
+    return {
+        "auction_id": auction["uuid"],
+        "seller": auction["auctioneer"],
+        "seller_profile": auction["profile_id"],
+        "buyer": _uuid(rng),
+        "timestamp": now - rng.randint(0, 60_000),
+        "price": max(auction["starting_bid"], auction["highest_bid_amount"]),
+        "bin": auction["bin"],
+        "item_bytes": auction["item_bytes"],
+    }
+
+
+def generate_player(rng: random.Random, uuid: str):
+    now = int(time.time() * 1000)
+    first_login = now - rng.randint(86_400_000, 10 * 365 * 86_400_000)
+    bedwars = {"Experience": rng.randint(0, 5_000_000), "coins": rng.randint(0, 10_000_000)}
+    for prefix in ["", "eight_one_", "eight_two_", "four_three_", "four_four_", "two_four_"]:
+        wins = rng.randint(0, 5000)
+        losses = rng.randint(0, 5000)
+        bedwars.update(
+            {
+                f"{prefix}games_played_bedwars": wins + losses,
+                f"{prefix}wins_bedwars": wins,
+                f"{prefix}losses_bedwars": losses,
+                f"{prefix}final_kills_bedwars": rng.randint(0, 20000),
+                f"{prefix}final_deaths_bedwars": rng.randint(0, 5000),
+                f"{prefix}kills_bedwars": rng.randint(0, 30000),
+                f"{prefix}deaths_bedwars": rng.randint(0, 30000),
+                f"{prefix}beds_broken_bedwars": rng.randint(0, 10000),
+                f"{prefix}beds_lost_bedwars": rng.randint(0, 5000),
+            }
+        )
+    return {
+        "uuid": uuid,
+        "displayname": f"Player{rng.randint(0, 10**6)}",
+        "newPackageRank": rng.choice(["NONE", "VIP", "VIP_PLUS", "MVP", "MVP_PLUS"]),
+        "firstLogin": first_login,
+        "lastLogin": now - rng.randint(0, 86_400_000),
+        "lastLogout": now - rng.randint(0, 86_400_000),
+        "stats": {"Bedwars": bedwars},
+    }
+
+
+def generate_profile(rng: random.Random, profile_id: str, members: list[str]):
+    now = int(time.time() * 1000)
+    return {
+        "profile_id": profile_id,
+        "members": {i: {} for i in members},
+        "cute_name": rng.choice(["Apple", "Banana", "Blueberry", "Coconut", "Cucumber", "Grapes"]),
+        "selected": rng.random() < 0.5,
+        "community_upgrades": {},
+        "banking": {
+            "balance": rng.uniform(0, 10**9),
+            "transactions": [
+                {
+                    "timestamp": now - rng.randint(0, 10**9),
+                    "action": rng.choice(["DEPOSIT", "WITHDRAW"]),
+                    "initiator_name": f"Player{rng.randint(0, 10**6)}",
+                    "amount": rng.uniform(0, 10**7),
+                }
+                for _ in range(rng.randint(0, 10))
+            ],
+        },
+    }
+
+
+def generate_product(rng: random.Random, product_id: str):
+    price = rng.uniform(1, 100_000)
+
+    def summary(factor: float):
+        return [
+            {
+                "amount": rng.randint(1, 100_000),
+                "pricePerUnit": round(price * factor ** (i + 1), 1),
+                "orders": rng.randint(1, 50),
+            }
+            for i in range(30)
+        ]
+
+    quick_status = {"productId": product_id}
+    for side in ["sell", "buy"]:
+        quick_status.update(
+            {
+                f"{side}Price": price,
+                f"{side}Volume": rng.randint(0, 10**7),
+                f"{side}MovingWeek": rng.randint(0, 10**9),
+                f"{side}Orders": rng.randint(0, 1000),
+            }
+        )
+    return {
+        "product_id": product_id,
+        "sell_summary": summary(0.99),
+        "buy_summary": summary(1.01),
+        "quick_status": quick_status,
+    }
+
+
+class StandInServer:
+    """An aiohttp server emulating `/player`, `/skyblock/profile(s)`, `/skyblock/bazaar` and `/skyblock/auctions(_ended)`.
+    Use it as an async context manager; `url` is the base URL to hand to `Hypixel`.
+    """
+
+    def __init__(self, config: StandInConfig | None = None, host: str = "127.0.0.1", port: int = 0):
+        self.config = config or StandInConfig()
+        self.host = host
+        self.port = port
+        self._rng = random.Random(self.config.seed)
+        self._windows: dict[str, _RateWindow] = {}
+        self._auction_pages: list[bytes] = []
+        self._bazaar: bytes = b""
+        self._ended_auctions: list[dict] = []
+        self._runner: web.AppRunner | None = None
+        self.app = web.Application()
+        self.app.add_routes(
+            [
+                web.get("/player", self._player),
+                web.get("/skyblock/profile", self._profile),
+                web.get("/skyblock/profiles", self._profiles),
+                web.get("/skyblock/bazaar", self._bazaar_handler),
+                web.get("/skyblock/auctions", self._auctions),
+                web.get("/skyblock/auctions_ended", self._auctions_ended),
+            ]
+        )
+        self.app.on_startup.append(self._generate)
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}"
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc, exc_info, traceback):
+        await self.close()
+
+    async def start(self):
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+
+    async def close(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _generate(self, app: web.Application):
+        # Pages are generated once and served from memory so the server isn't the bottleneck.
+        config = self.config
+        now = int(time.time() * 1000)
+        total = config.auction_pages * config.auctions_per_page
+        for page in range(config.auction_pages):
+            auctions = [generate_auction(self._rng, now) for _ in range(config.auctions_per_page)]
+            self._auction_pages.append(
+                json.dumps(
+                    {
+                        "success": True,
+                        "page": page,
+                        "totalPages": config.auction_pages,
+                        "totalAuctions": total,
+                        "lastUpdated": now,
+                        "auctions": auctions,
+                    }
+                ).encode()
+            )
+        product_ids = [
+            BAZAAR_PRODUCTS[i] if i < len(BAZAAR_PRODUCTS) else f"PRODUCT_{i}"
+            for i in range(config.bazaar_products)
+        ]
+        self._bazaar = json.dumps(
+            {
+                "success": True,
+                "lastUpdated": now,
+                "products": {i: generate_product(self._rng, i) for i in product_ids},
+            }
+        ).encode()
+        # Ended auctions are served as a slice of this pool with fresh timestamps.
+        self._ended_auctions = [generate_ended_auction(self._rng, now) for _ in range(ENDED_AUCTIONS)]
+
+    async def _delay(self):
+        if self._rng.random() < self.config.slow_rate:
+            await asyncio.sleep(self.config.slow_latency)
+        else:
+            await asyncio.sleep(self.config.latency + self._rng.uniform(0, self.config.jitter))
+        if self._rng.random() < self.config.error_rate:
+            raise web.HTTPServiceUnavailable()
+
+    def _respond(self, body: bytes | dict, status: int = 200, headers: dict | None = None):
+        if isinstance(body, dict):
+            body = json.dumps(body).encode()
+        response = web.Response(body=body, status=status, headers=headers, content_type="application/json")
+        if self.config.compress:
+            response.enable_compression()
+        return response
+
+    def _error(self, status: int, cause: str, headers: dict | None = None, **extra):
+        return self._respond({"success": False, "cause": cause, **extra}, status, headers)
+
+    def _check_key(self, request: web.Request):
+        """Returns rate limit headers, or an error response if the request should be refused."""
+        key = request.headers.get("API-Key")
+        if not key:
+            return self._error(403, "Invalid API key")
+        now = time.monotonic()
+        window = self._windows.get(key)
+        if window is None or now - window.start >= self.config.rate_window:
+            window = self._windows[key] = _RateWindow(now)
+        reset = max(0, int(window.start + self.config.rate_window - now))
+        if window.used >= self.config.rate_limit:
+            headers = {
+                "RateLimit-Limit": str(self.config.rate_limit),
+                "RateLimit-Remaining": "0",
+                "RateLimit-Reset": str(reset),
+                "Retry-After": str(reset),
+            }
+            return self._error(429, "Key throttle", headers, throttle=True)
+        window.used += 1
+        return {
+            "RateLimit-Limit": str(self.config.rate_limit),
+            "RateLimit-Remaining": str(self.config.rate_limit - window.used),
+            "RateLimit-Reset": str(reset),
+        }
+
+    async def _player(self, request: web.Request):
+        await self._delay()
+        headers = self._check_key(request)
+        if isinstance(headers, web.Response):
+            return headers
+        if "uuid" not in request.query:
+            return self._error(400, "Missing one or more fields [uuid]", headers)
+        uuid = request.query["uuid"]
+        player = generate_player(random.Random(uuid), uuid)
+        return self._respond({"success": True, "player": player}, headers=headers)
+
+    async def _profile(self, request: web.Request):
+        await self._delay()
+        headers = self._check_key(request)
+        if isinstance(headers, web.Response):
+            return headers
+        if "profile" not in request.query:
+            return self._error(400, "Missing one or more fields [profile]", headers)
+        profile_id = request.query["profile"]
+        rng = random.Random(profile_id)
+        profile = generate_profile(rng, profile_id, [_uuid(rng) for _ in range(rng.randint(1, 4))])
+        return self._respond({"success": True, "profile": profile}, headers=headers)
+
+    async def _profiles(self, request: web.Request):
+        await self._delay()
+        headers = self._check_key(request)
+        if isinstance(headers, web.Response):
+            return headers
+        if "uuid" not in request.query:
+            return self._error(400, "Missing one or more fields [uuid]", headers)
+        uuid = request.query["uuid"]
+        rng = random.Random(uuid)
+        profiles = [generate_profile(rng, _uuid(rng), [uuid]) for _ in range(rng.randint(1, 5))]
+        return self._respond({"success": True, "profiles": profiles}, headers=headers)
+
+    async def _bazaar_handler(self, request: web.Request):
+        await self._delay()
+        return self._respond(self._bazaar)
+
+    async def _auctions(self, request: web.Request):
+        await self._delay()
+        try:
+            page = int(request.query.get("page", 0))
+        except ValueError:
+            return self._error(422, "Invalid page")
+        if not 0 <= page < len(self._auction_pages):
+            return self._error(404, "Page not found")
+        return self._respond(self._auction_pages[page])
+
+    async def _auctions_ended(self, request: web.Request):
+        await self._delay()
+        now = int(time.time() * 1000)
+        count = self._rng.randint(ENDED_AUCTIONS // 3, ENDED_AUCTIONS)
+        start = self._rng.randint(0, ENDED_AUCTIONS - count)
+        auctions = [
+            {**i, "timestamp": now - self._rng.randint(0, 60_000)}
+            for i in self._ended_auctions[start : start + count]
+        ]
+        return self._respond({"success": True, "lastUpdated": now, "auctions": auctions})
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Run a local stand-in for the Hypixel API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=StandInConfig.latency)
+    parser.add_argument("--jitter", type=float, default=StandInConfig.jitter)
+    parser.add_argument("--rate-limit", type=int, default=StandInConfig.rate_limit)
+    parser.add_argument("--rate-window", type=float, default=StandInConfig.rate_window)
+    parser.add_argument("--auction-pages", type=int, default=StandInConfig.auction_pages)
+    parser.add_argument("--seed", type=int, default=StandInConfig.seed)
+    parser.add_argument("--no-compress", dest="compress", action="store_false")
+    parser.add_argument("--slow-rate", type=float, default=StandInConfig.slow_rate)
+    parser.add_argument("--slow-latency", type=float, default=StandInConfig.slow_latency)
+    parser.add_argument("--error-rate", type=float, default=StandInConfig.error_rate)
+    args = parser.parse_args(argv)
+    config = StandInConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        rate_limit=args.rate_limit,
+        rate_window=args.rate_window,
+        auction_pages=args.auction_pages,
+        seed=args.seed,
+        compress=args.compress,
+        slow_rate=args.slow_rate,
+        slow_latency=args.slow_latency,
+        error_rate=args.error_rate,
+    )
+    server = StandInServer(config, args.host, args.port)
+    web.run_app(server.app, host=args.host, port=args.port, access_log=None)
+
+
+if __name__ == "__main__":
+    main()
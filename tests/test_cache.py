@@ -0,0 +1,17 @@
+import sqlite3
+import pytest
+from hypixel.cache import SQLiteCache
+
+
+def test_close_on_busy_database_still_closes(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    cache = SQLiteCache(path, timeout=0.01)
+    other = sqlite3.connect(path)
+    other.execute("BEGIN IMMEDIATE")
+    try:
+        cache.close()
+    finally:
+        other.rollback()
+        other.close()
+    with pytest.raises(sqlite3.ProgrammingError):
+        cache._conn.execute("SELECT 1")
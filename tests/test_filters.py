@@ -0,0 +1,152 @@
+import pytest
+from hypixel.nbt import dump_data
+from hypixel.skyblock.auctionhouse import Auction, AuctionHouse
+from hypixel.skyblock.filters import AuctionFilter, Attribute, PriceRange, Rule
+
+
+def make_auction_json(item_id="HYPERION", price=1000, tier="LEGENDARY", lore="§7Sharpness 5", **extra):
+    item = {
+        "id": 267,
+        "Count": 1,
+        "tag": {"ExtraAttributes": {"id": item_id, **extra}, "display": {"Name": item_id, "Lore": [lore]}},
+    }
+    return {
+        "uuid": f"{item_id}-{price}",
+        "auctioneer": "seller",
+        "profile_id": "profile",
+        "coop": [],
+        "start": 0,
+        "end": 3_600_000,
+        "item_name": item_id,
+        "item_lore": lore,
+        "extra": "",
+        "category": "weapon",
+        "tier": tier,
+        "starting_bid": price,
+        "item_bytes": dump_data({"i": [item]}).decode("ascii"),
+        "claimed": False,
+        "claimed_bidders": [],
+        "highest_bid_amount": 0,
+        "bin": True,
+        "bids": [],
+    }
+
+
+def make_auction(**kwargs):
+    return Auction.process_json(make_auction_json(**kwargs))
+
+
+def test_rule_matches_all_criteria():
+    auction_filter = AuctionFilter(
+        [
+            Rule("cheap", item_id="HYPERION", max_price=2000, tiers={"LEGENDARY"}, lore="Sharpness"),
+            Rule("expensive", item_id="HYPERION", min_price=2000),
+        ]
+    )
+    assert [i.name for i in auction_filter.match(make_auction(price=1000))] == ["cheap"]
+    assert [i.name for i in auction_filter.match(make_auction(price=5000))] == ["expensive"]
+
+
+def test_shared_conditions_are_compiled_once():
+    auction_filter = AuctionFilter(
+        [
+            Rule("a", item_id="HYPERION", max_price=2000),
+            Rule("b", item_id="HYPERION", max_price=2000, tiers={"LEGENDARY"}),
+            Rule("c", max_price=2000),
+        ]
+    )
+    compiled = auction_filter.compile()
+    assert compiled.conditions.count(PriceRange(None, 2000)) == 1
+    assert len(compiled.conditions) == 2
+
+
+def test_shared_conditions_are_evaluated_once(monkeypatch):
+    calls = []
+    test = PriceRange.test
+    monkeypatch.setattr(PriceRange, "test", lambda self, auction: calls.append(self) or test(self, auction))
+    auction_filter = AuctionFilter([Rule(str(i), item_id="HYPERION", max_price=2000) for i in range(50)])
+    assert len(auction_filter.match(make_auction(price=1000))) == 50
+    assert len(calls) == 1
+
+
+def test_rules_are_indexed_by_item_id(monkeypatch):
+    calls = []
+    test = PriceRange.test
+    monkeypatch.setattr(PriceRange, "test", lambda self, auction: calls.append(self) or test(self, auction))
+    auction_filter = AuctionFilter(
+        [
+            Rule("hyperion", item_id="HYPERION", max_price=2000),
+            Rule("terminator", item_id="TERMINATOR", max_price=3000),
+            Rule("anything", min_price=500),
+        ]
+    )
+    matches = auction_filter.match(make_auction(item_id="TERMINATOR", price=1000))
+    assert [i.name for i in matches] == ["terminator", "anything"]
+    assert PriceRange(None, 2000) not in calls
+
+
+def test_subscribers_are_notified():
+    auction_filter = AuctionFilter()
+    per_rule, every_rule = [], []
+    auction_filter.add(Rule("hyperion", item_id="HYPERION"), lambda rule, auction: per_rule.append(auction.uuid))
+    auction_filter.add(Rule("cheap", max_price=2000))
+    auction_filter.subscribe(lambda rule, auction: every_rule.append(rule.name))
+    auction_filter.feed(make_auction(price=1000))
+    assert per_rule == ["HYPERION-1000"]
+    assert sorted(every_rule) == ["cheap", "hyperion"]
+
+
+def test_attribute_conditions():
+    auction = make_auction(enchantments={"sharpness": 6}, modifier="heroic", hot_potato_count=10)
+    assert Attribute("enchantments.sharpness", ">=", 6).test(auction)
+    assert not Attribute("enchantments.sharpness", ">", 6).test(auction)
+    assert Attribute("modifier", "==", "heroic").test(auction)
+    assert Attribute("enchantments", "in", "sharpness").test(auction)
+    assert not Attribute("enchantments.growth").test(auction)
+    assert not Attribute("modifier", "<", 5).test(auction)
+
+
+def test_in_on_non_container_fails_instead_of_raising():
+    auction_json = make_auction_json(hot_potato_count=10)
+    auction_filter = AuctionFilter([Rule("potato", attributes=[Attribute("hot_potato_count", "in", 5)])])
+    house = AuctionHouse.process_json(
+        {"page": 0, "totalPages": 1, "totalAuctions": 2, "lastUpdated": 0, "auctions": [auction_json, auction_json]},
+        auction_filter.feed,
+    )
+    assert len(house.auctions) == 2
+
+
+def test_list_values_are_hashable():
+    condition = Attribute("modifier", "==", ["heroic"])
+    assert condition.value == ("heroic",)
+    auction_filter = AuctionFilter([Rule("list", attributes=[condition])])
+    assert auction_filter.match(make_auction(modifier="heroic")) == []
+
+
+def test_list_value_matches_list_attribute():
+    auction = make_auction(gems=["RUBY", "JADE"])
+    assert Attribute("gems", "==", ["RUBY", "JADE"]).test(auction)
+
+
+def test_unhashable_value_is_rejected():
+    with pytest.raises(ValueError):
+        Attribute("enchantments", "==", {"sharpness": 5})
+
+
+def test_auction_without_item_id_matches_any_item_rules_once():
+    auction_json = make_auction_json(price=1000)
+    auction_json["item_bytes"] = dump_data({"i": [{"id": 1, "Count": 1, "tag": {}}]}).decode("ascii")
+    auction = Auction.process_json(auction_json)
+    assert auction.item_id is None
+    auction_filter = AuctionFilter([Rule("cheap", max_price=5000)])
+    notified = []
+    auction_filter.subscribe(lambda rule, auction: notified.append(rule.name))
+    assert [i.name for i in auction_filter.feed(auction)] == ["cheap"]
+    assert notified == ["cheap"]
+
+
+def test_single_tier_and_category_strings():
+    rule = Rule("legendary", tiers="LEGENDARY", categories="weapon")
+    assert rule.tiers == frozenset({"LEGENDARY"})
+    assert rule.categories == frozenset({"weapon"})
+    assert AuctionFilter([rule]).match(make_auction()) == [rule]
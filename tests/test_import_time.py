@@ -0,0 +1,35 @@
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+# Cumulative microseconds allowed for `import hypixel`. It takes a few milliseconds when lazy;
+# importing aiohttp eagerly costs well over 100ms, so this leaves room for slow machines.
+BUDGET_US = 50_000
+
+
+def import_hypixel():
+    env = {**os.environ, "PYTHONPATH": str(ROOT)}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import sys, hypixel; print('aiohttp' in sys.modules)"],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=ROOT,
+        check=True,
+    )
+    match = re.search(r"^import time:\s*\d+ \|\s*(\d+) \| hypixel$", result.stderr, re.MULTILINE)
+    assert match, result.stderr
+    return int(match.group(1)), result.stdout.strip() == "True"
+
+
+def test_import_is_within_budget():
+    cumulative, _ = import_hypixel()
+    assert cumulative < BUDGET_US
+
+
+def test_import_does_not_load_aiohttp():
+    _, aiohttp_loaded = import_hypixel()
+    assert not aiohttp_loaded
@@ -0,0 +1,119 @@
+import json
+import random
+from datetime import datetime, timedelta
+import pytest
+from hypixel.skyblock.auctionhouse import EndedAuction
+from hypixel.skyblock.prices import DecayedAverage, PriceStats, QuantileSketch
+
+HOUR = 60 * 60
+
+
+def make_sales(seed: int, count: int = 2000):
+    rng = random.Random(seed)
+    return [
+        (rng.choice(["HYPERION", "TERMINATOR"]), rng.lognormvariate(12, 2), rng.uniform(0, 48 * HOUR))
+        for _ in range(count)
+    ]
+
+
+def make_ended_auction(timestamp: datetime, price: int = 1000, count: int = 1, item_id: str = "ENCHANTED_DIAMOND"):
+    return EndedAuction(
+        auction_id=f"{item_id}-{timestamp.timestamp()}",
+        seller="seller",
+        seller_profile="profile",
+        buyer="buyer",
+        timestamp=timestamp,
+        price=price,
+        bin=True,
+        item_data={"i": [{"id": 264, "Count": count, "tag": {"ExtraAttributes": {"id": item_id}}}]},
+    )
+
+
+def test_quantiles_are_within_relative_accuracy():
+    rng = random.Random(0)
+    values = [rng.lognormvariate(10, 1) for _ in range(10_000)]
+    sketch = QuantileSketch(relative_accuracy=0.01)
+    for value in values:
+        sketch.add(value)
+    # Spread over about 400 buckets, so none are collapsed.
+    assert len(sketch.bins) < sketch.max_bins
+    ordered = sorted(values)
+    for q in (0, 0.01, 0.25, 0.5, 0.75, 0.99, 1):
+        expected = ordered[int(q * (len(ordered) - 1))]
+        assert sketch.quantile(q) == pytest.approx(expected, rel=0.01)
+
+
+def test_collapse_bounds_bins_and_keeps_high_quantiles():
+    values = [1.5**i for i in range(100)]
+    sketch = QuantileSketch(relative_accuracy=0.01, max_bins=20)
+    for value in values:
+        sketch.add(value)
+    assert len(sketch.bins) == 20
+    assert sketch.count == 100
+    assert sketch.quantile(0.99) == pytest.approx(values[98], rel=0.01)
+    assert sketch.quantile(1) == pytest.approx(values[99], rel=0.01)
+
+
+def test_merged_shards_match_single_stats():
+    single, first, second = PriceStats(), PriceStats(), PriceStats()
+    for i, (item_id, price, timestamp) in enumerate(make_sales(1)):
+        single.add(item_id, price, timestamp)
+        (first if i % 2 else second).add(item_id, price, timestamp)
+    first.merge(second)
+    assert first.items.keys() == single.items.keys()
+    for item_id, prices in single.items.items():
+        merged = first[item_id]
+        assert merged.sketch.to_dict() == prices.sketch.to_dict()
+        assert merged.average.value == pytest.approx(prices.average.value)
+        assert merged.last_sold == prices.last_sold
+
+
+def test_decayed_average_merge_out_of_order():
+    values = [(100, 0), (200, HOUR), (400, 3 * HOUR), (800, 2 * HOUR)]
+    single = DecayedAverage(HOUR)
+    for value, timestamp in values:
+        single.add(value, timestamp)
+    later, earlier = DecayedAverage(HOUR), DecayedAverage(HOUR)
+    for value, timestamp in values[2:]:
+        later.add(value, timestamp)
+    for value, timestamp in values[:2]:
+        earlier.add(value, timestamp)
+    later.merge(earlier)
+    assert later.timestamp == 3 * HOUR
+    assert later.value == pytest.approx(single.value)
+
+
+def test_round_trip_through_json():
+    stats = PriceStats(relative_accuracy=0.02, max_bins=64, half_life=HOUR)
+    for item_id, price, timestamp in make_sales(2, 500):
+        stats.add(item_id, price, timestamp)
+    stats.add("FREE", 0, 0)
+    restored = PriceStats.from_dict(json.loads(json.dumps(stats.to_dict())))
+    assert restored.to_dict() == stats.to_dict()
+    assert restored["HYPERION"].median == stats["HYPERION"].median
+    assert restored["FREE"].sales == 1
+
+
+@pytest.mark.parametrize("config", [{"relative_accuracy": 0.02}, {"half_life": HOUR}])
+def test_mismatched_shard_is_rejected_without_changes(config):
+    stats, shard = PriceStats(), PriceStats(**config)
+    for item_id, price, timestamp in make_sales(3, 100):
+        stats.add(item_id, price, timestamp)
+        shard.add(item_id, price, timestamp)
+    shard.add("NEW_ITEM", 10, 0)
+    before = stats.to_dict()
+    with pytest.raises(ValueError):
+        stats.merge(shard)
+    assert stats.to_dict() == before
+
+
+def test_since_skips_already_seen_sales():
+    stats = PriceStats()
+    poll = datetime(2024, 1, 1, 12)
+    seen = make_ended_auction(poll - timedelta(seconds=30))
+    new = make_ended_auction(poll + timedelta(seconds=30), price=640, count=64)
+    assert stats.add_ended_auction(seen)
+    assert not stats.add_ended_auction(seen, since=poll)
+    assert stats.add_ended_auction(new, since=poll)
+    assert stats["ENCHANTED_DIAMOND"].sales == 2
+    assert stats["ENCHANTED_DIAMOND"].quantile(0) == pytest.approx(10, rel=0.01)
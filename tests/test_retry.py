@@ -0,0 +1,52 @@
+import asyncio
+import pytest
+from hypixel.retry import RetryBudget, RetryPolicy
+
+
+class Flaky:
+    def __init__(self, failures: int):
+        self.failures = failures
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise ConnectionError
+        return "ok"
+
+
+def run(policy: RetryPolicy, request: Flaky):
+    return asyncio.run(policy.run("/player", request, (ConnectionError,)))
+
+
+def test_first_failed_request_is_retried():
+    policy = RetryPolicy(attempts=3, base_delay=0)
+    request = Flaky(failures=1)
+    assert run(policy, request) == "ok"
+    assert request.calls == 2
+    assert policy.retries == 1
+
+
+def test_budget_caps_retries():
+    policy = RetryPolicy(attempts=100, base_delay=0, budget=0.25)
+    request = Flaky(failures=1000)
+    with pytest.raises(ConnectionError):
+        run(policy, request)
+    # The initial allowance is spent, after which each request only earns a quarter of a retry.
+    assert policy.retries == 10
+    for _ in range(3):
+        with pytest.raises(ConnectionError):
+            run(policy, request)
+    assert policy.retries == 10
+    with pytest.raises(ConnectionError):
+        run(policy, request)
+    assert policy.retries == 11
+
+
+def test_budget_starts_full():
+    assert RetryBudget(max_tokens=5).tokens == 5
+
+
+def test_attempts_must_be_positive():
+    with pytest.raises(ValueError):
+        RetryPolicy(attempts=0)
@@ -0,0 +1,32 @@
+import asyncio
+import aiohttp
+from hypixel.standin import StandInConfig, StandInServer
+
+
+def test_default_negotiation_gets_compressed_response():
+    async def fetch():
+        config = StandInConfig(latency=0, jitter=0, auction_pages=1, auctions_per_page=10)
+        async with StandInServer(config) as server, aiohttp.ClientSession() as session:
+            async with session.get(server.url + "/skyblock/bazaar") as response:
+                body = await response.json()
+                return response.headers.get("Content-Encoding"), body
+
+    encoding, body = asyncio.run(fetch())
+    assert encoding in {"gzip", "deflate", "br", "zstd"}
+    assert body["success"]
+
+
+def test_ended_auctions_have_fresh_timestamps():
+    async def fetch():
+        config = StandInConfig(latency=0, jitter=0, auction_pages=1, auctions_per_page=10)
+        async with StandInServer(config) as server, aiohttp.ClientSession() as session:
+            pages = []
+            for _ in range(2):
+                async with session.get(server.url + "/skyblock/auctions_ended") as response:
+                    pages.append(await response.json())
+            return pages
+
+    for page in asyncio.run(fetch()):
+        assert 500 <= len(page["auctions"]) <= 1500
+        assert len({i["auction_id"] for i in page["auctions"]}) == len(page["auctions"])
+        assert all(page["lastUpdated"] - 60_000 <= i["timestamp"] <= page["lastUpdated"] for i in page["auctions"])